@@ -1,23 +1,47 @@
+import argparse
 import gmpy2
-from Crypto.Util.number import *
-from factordb.factordb import FactorDB
-import math
+import re
+import sys
 from rich.console import Console
-
-from lib.FranklinReiter import FranklinReiter
-from lib.ModuleCommun import common_modulus
-from lib.PremierCommun import PremierCommun
-from lib.PubkeyExtract import extract_public_key
-from lib.RSAPrivateKey import PrivateKey
-from lib.RSAdec import Encode,Decode
-from lib.RSAfactorisation import factorisation
-from lib.Wiener import wiener
-from lib.pollar import PollardAttack
 from termcolor import colored
 
 
 console = Console()
 
+MENU = colored('''
+    1) Franklin-Reiter Attack
+    2) Common Modulus Attack
+    3) Simple Factorization Attack
+    4) Wiener's Attack
+    5) Simple RSA Encoding and Decoding
+    6) Pollard's Rho Attack
+    7) Public Key Parameters Extraction
+    8) Common Prime Factor Attack
+    9) Private Key Computation
+    10) Pollard's p-1 Attack
+    0) Exit
+    ''',"blue")
+
+def parse_int(s):
+    # GMP's base conversion is sub-quadratic, int(str) is quadratic and capped at 4300 digits
+    return gmpy2.mpz(s.strip(), 0)
+
+def read_int(prompt, default=None):
+    s = input(prompt)
+    if not s.strip() and default is not None:
+        return default
+    return parse_int(s)
+
+def read_int_list(prompt):
+    print (prompt)
+    data = []
+    while True:
+        line = input()
+        if not line.strip():
+            break
+        data.append(line)
+    return [parse_int(tok) for tok in re.split(r"[,\s]+", " ".join(data)) if tok]
+
 def banner():
     banner = '''[bold cyan]
   ______      __           ___           __
@@ -30,25 +54,141 @@ def banner():
     '''
     console.print (banner)
 
+def run_franklin_reiter(args):
+    from lib.FranklinReiter import FranklinReiter
+    m1, m2 = FranklinReiter(args.n, args.e, args.c1, args.c2, args.a, args.b)
+    print (f"[*] RESULT :")
+    print (colored(f"[+] M1 = {m1}","green"))
+    print (colored(f"[+] M2 = {m2}", "green"))
+
+def run_common_modulus(args):
+    from lib.ModuleCommun import common_modulus
+    m = common_modulus(args.n, args.e1, args.e2, args.c1, args.c2)
+    console.print (f"[*][bold yellow]RESULT : {m}[/bold yellow]")
+
+def run_factorisation(args):
+    from lib.RSAfactorisation import factorisation
+    factorisation(args.n)
+
+def run_wiener(args):
+    from lib.Wiener import wiener
+    d = wiener(args.n, args.e)
+    if d:
+        console.print(f"[bold green][+] FOUND d = {d}[/bold green]")
+    else:
+        print(colored("Failed!", "red"))
+
+def run_encode(args):
+    from lib.RSAdec import Encode
+    Encode(args.e, args.n, args.m)
+
+def run_decode(args):
+    from lib.RSAdec import Decode
+    Decode(args.c, args.n, args.d, args.p, args.q)
+
+def run_pollard_rho(args):
+    from lib.pollar import PollardRho
+    PollardRho(args.n)
+
+def run_pollard_p1(args):
+    from lib.pollar import PollardAttack
+    PollardAttack(args.B, args.n)
+
+def run_extract(args):
+    from lib.PubkeyExtract import extract_public_key
+    n, e = extract_public_key(args.file)
+    print (colored(f"[+] N = {n}","green"))
+    print (colored(f"[+] E = {e}", "green"))
+
+def run_common_prime(args):
+    from lib.PremierCommun import PremierCommun
+    moduli = list(args.moduli)
+    if args.moduli_file:
+        with open(args.moduli_file) as f:
+            moduli += [parse_int(tok) for tok in re.split(r"[,\s]+", f.read()) if tok]
+    PremierCommun(*moduli)
+
+def run_private_key(args):
+    from lib.RSAPrivateKey import PrivateKey
+    d = PrivateKey(args.p, args.q, args.e)
+    console.print (f"[bold green]Succesfull retrieved, d = {d} [/bold green]")
+
+def batch(argv):
+    parser = argparse.ArgumentParser(prog="cipherbuster.py", description="Run a single attack without the interactive menu.")
+    sub = parser.add_subparsers(dest="attack", required=True)
+
+    p = sub.add_parser("franklin-reiter", help="Franklin-Reiter Attack")
+    for arg in ("n", "e", "c1", "c2", "a", "b"):
+        p.add_argument(f"--{arg}", type=parse_int, required=True)
+    p.set_defaults(func=run_franklin_reiter)
+
+    p = sub.add_parser("common-modulus", help="Common Modulus Attack")
+    for arg in ("n", "e1", "e2", "c1", "c2"):
+        p.add_argument(f"--{arg}", type=parse_int, required=True)
+    p.set_defaults(func=run_common_modulus)
+
+    p = sub.add_parser("factorize", help="Simple Factorization Attack")
+    p.add_argument("--n", type=parse_int, required=True)
+    p.set_defaults(func=run_factorisation)
+
+    p = sub.add_parser("wiener", help="Wiener's Attack")
+    p.add_argument("--n", type=parse_int, required=True)
+    p.add_argument("--e", type=parse_int, required=True)
+    p.set_defaults(func=run_wiener)
+
+    p = sub.add_parser("encode", help="Simple RSA Encoding")
+    for arg in ("e", "n", "m"):
+        p.add_argument(f"--{arg}", type=parse_int, required=True)
+    p.set_defaults(func=run_encode)
+
+    p = sub.add_parser("decode", help="Simple RSA Decoding")
+    for arg in ("c", "n", "d"):
+        p.add_argument(f"--{arg}", type=parse_int, required=True)
+    p.add_argument("--p", type=parse_int, help="with --q, decrypt through the CRT")
+    p.add_argument("--q", type=parse_int)
+    p.set_defaults(func=run_decode)
+
+    p = sub.add_parser("pollard-rho", help="Pollard's Rho Attack")
+    p.add_argument("--n", type=parse_int, required=True)
+    p.set_defaults(func=run_pollard_rho)
+
+    p = sub.add_parser("extract", help="Public Key Parameters Extraction")
+    p.add_argument("--file", required=True)
+    p.set_defaults(func=run_extract)
+
+    p = sub.add_parser("common-prime", help="Common Prime Factor Attack")
+    p.add_argument("--moduli", type=parse_int, nargs="*", default=[])
+    p.add_argument("--moduli-file")
+    p.set_defaults(func=run_common_prime)
+
+    p = sub.add_parser("private-key", help="Private Key Computation")
+    for arg in ("p", "q", "e"):
+        p.add_argument(f"--{arg}", type=parse_int, required=True)
+    p.set_defaults(func=run_private_key)
+
+    p = sub.add_parser("pollard-p1", help="Pollard's p-1 Attack")
+    p.add_argument("--B", type=parse_int, default=2)
+    p.add_argument("--n", type=parse_int, required=True)
+    p.set_defaults(func=run_pollard_p1)
+
+    args = parser.parse_args(argv)
+    if args.func is run_decode and (args.p is None) != (args.q is None):
+        parser.error("decode: --p and --q must be given together")
+    if args.func is run_decode and args.p is not None and (args.p == args.q or args.p * args.q != args.n):
+        parser.error("decode: --p and --q must be two distinct factors of --n")
+    args.func(args)
+
 def main():
+    if len(sys.argv) > 1:
+        batch(sys.argv[1:])
+        return
+
     banner()
     desc = "This framework is a tool dedicated to exploiting vulnerabilities in RSA encryption."
     print (colored(desc,'yellow'))
-    attack = '''
-    1) Franklin-Reiter Attack
-    2) Common Modulus Attack
-    3) Simple Factorization Attack
-    4) Wiener's Attack
-    5) Simple RSA Encoding and Decoding
-    6) Pollard's Rho Attack
-    7) Public Key Parameters Extraction
-    8) Common Prime Factor Attack
-    9) Private Key Computation
-    0) Exit
-    '''
 
     print ("")
-    print (colored(attack,"blue"))
+    print (MENU)
     print ("")
 
     while True:
@@ -56,49 +196,42 @@ def main():
          choix = int(input("Enter a number: "))
          if (choix==1):
             print (colored("Franklin-Reiter Attack ........","magenta"))
-            print (colored("Suppose there are two messages M1 and M2 where M1 != M2, both less than N and related to each other as equation [ M1 = f(M2) (mod N) ] for some linear polynomial equation [ f = ax + b ] where b!=0. These two messages are to be sent by encrypting using the public key (N, e), thus giving ciphertexts C1 and C2 respectively. Then, given (N, e, C1, C2, f), the attacker can recover messages M1 and M2","green"))
-            N = gmpy2.mpz(int(input("Enter the value of N: ")))
-            e = gmpy2.mpz(int(input("Enter the value of e: ")))
-            C1 = gmpy2.mpz(int(input("Enter the value of the first Cipher (C1): ")))
-            C2 = gmpy2.mpz(int(input("Enter the value of the second cipher (C2): ")))
-            a = gmpy2.mpz(int(input("Enter the value of a in the linear function: ")))
-            b = gmpy2.mpz(int(input("Enter the value of b in the linear function: ")))
-            m1, m2 = FranklinReiter(N,e,C1,C2,a,b)
-            print (f"[*] RESULT :")
-            print (colored(f"[+] M1 = {m1}","green"))
-            print (colored(f"[+] M2 = {m2}", "green"))
+            print (colored("Suppose there are two messages M1 and M2 where M1 != M2, both less than N and related to each other as equation [ M2 = f(M1) (mod N) ] for some linear polynomial equation [ f = ax + b ] where b!=0. These two messages are to be sent by encrypting using the public key (N, e), thus giving ciphertexts C1 and C2 respectively. Then, given (N, e, C1, C2, f), the attacker can recover messages M1 and M2","green"))
+            N = read_int("Enter the value of N: ")
+            e = read_int("Enter the value of e: ")
+            C1 = read_int("Enter the value of the first Cipher (C1): ")
+            C2 = read_int("Enter the value of the second cipher (C2): ")
+            a = read_int("Enter the value of a in the linear function: ")
+            b = read_int("Enter the value of b in the linear function: ")
+            run_franklin_reiter(argparse.Namespace(n=N, e=e, c1=C1, c2=C2, a=a, b=b))
             exit()
 
          elif (choix==2):
             print (colored("Common Modulus Attack ........","magenta"))
             print (colored("This attack specifically targets the potential weakness of RSA encryption by exploiting relationships between ciphertexts encrypted with different exponents but the same modulus, compromising the security of the system","green"))
             print ("")
-            n = int(input("Enter the value of N: "))
-            e1 = int(input("Enter the first value of e: "))
-            e2 = int(input("Enter the second value of e: "))
-            c1 = int(input("Enter the first value of the Cipher: "))
-            c2 = int(input("Enter the second value of the Cipher: "))
-            console.print (f"[*][bold yellow]RESULT : {common_modulus(n,e1,e2,c1,c2)}[/bold yellow]")
+            n = read_int("Enter the value of N: ")
+            e1 = read_int("Enter the first value of e: ")
+            e2 = read_int("Enter the second value of e: ")
+            c1 = read_int("Enter the first value of the Cipher: ")
+            c2 = read_int("Enter the second value of the Cipher: ")
+            run_common_modulus(argparse.Namespace(n=n, e1=e1, e2=e2, c1=c1, c2=c2))
             exit()
 
          elif (choix==3):
             print (colored("Simple Factorization Attack ........","magenta"))
             print (colored("This attack targets RSA encryption by exploiting the difficulty of factoring large prime numbers used in generationg public and private keys","green"))
-            n = int(input("Enter the value of n: "))
-            print (input(colored("To launch this attack, ensure that you are connected to the internet!","red"))) 
-            factorisation(n)
+            n = read_int("Enter the value of n: ")
+            print (input(colored("Numbers that resist local factorization are looked up on FactorDB, ensure that you are connected to the internet!","red"))) 
+            run_factorisation(argparse.Namespace(n=n))
             exit()
 
          elif (choix==4):
             print (colored("Wiener's Attack ........","magenta"))
             print (colored("This attack specifically targeting systems where the private key d is too small relative to the modulus n, compromising security by allowing the recovery of the private key.","green"))
-            n = int(input("Enter the value of N: "))
-            e = int(input("Enter the value of e: "))
-            d = wiener(n,e)
-            if d:
-                print(f"[bold green][+] FOUND d = {d}[/bold green]")
-            else:
-                print(colored("Failed!", "red"))
+            n = read_int("Enter the value of N: ")
+            e = read_int("Enter the value of e: ")
+            run_wiener(argparse.Namespace(n=n, e=e))
             exit()
 
          elif (choix==5):
@@ -112,17 +245,19 @@ def main():
             print (colored(choices,"blue"))
             choice = int(input(">>>"))
             if (choice ==1):
-               e = int(input("Enter the value of e: "))
-               n = int(input("Enter the value of n: "))
-               m = int(input("Enter the value of the message as long: "))
-               Encode(e,n,m)
+               e = read_int("Enter the value of e: ")
+               n = read_int("Enter the value of n: ")
+               m = read_int("Enter the value of the message as long: ")
+               run_encode(argparse.Namespace(e=e, n=n, m=m))
                break
 
             elif (choice == 2):
-               c = int(input("Enter the value of the CipherText as long: "))
-               n = int(input("Enter the value of n: "))
-               d = int(input("Enter the value of the PrivateKey (d): "))
-               Decode(c,n,d)
+               c = read_int("Enter the value of the CipherText as long: ")
+               n = read_int("Enter the value of n: ")
+               d = read_int("Enter the value of the PrivateKey (d): ")
+               p = read_int("Enter the value of p (empty if unknown): ", 0)
+               q = read_int("Enter the value of q: ") if p else 0
+               run_decode(argparse.Namespace(c=c, n=n, d=d, p=p or None, q=q or None))
                break
 
             else:
@@ -133,37 +268,38 @@ def main():
          elif (choix==6):
               print (colored("Pollard's Rho Attack ......","magenta"))
               print (colored("This attack ","yellow"))
-              B = int(input("Enter the value of B (2 by default): "))
-              N = int(input("Enter the value of N: "))
-              PollardAttack(B,N)
+              N = read_int("Enter the value of N: ")
+              run_pollard_rho(argparse.Namespace(n=N))
               break
 
          elif (choix==7):
               print (colored("Public Key Parameters Extraction ......","magenta"))
               print (colored("This attack ","yellow"))
               filename = input("Enter the path of the Public Key File: ")
-              n, e = extract_public_key(filename)
-              while True:
-                  print (colored(f"[+] N = {n}","green"))
-                  print (colored(f"[+] E = {e}", "green"))
-                  break
+              run_extract(argparse.Namespace(file=filename))
 
          elif (choix==8):
               print (colored("Common Prime Factor Attack ......","magenta"))
               print (colored("This attack ","yellow"))
-              N1 = int(input("Enter the first value of N: "))
-              N2 = int(input("Enter the second value of N: "))
-              PremierCommun(N1,N2)
+              moduli = read_int_list("Enter the values of N separated by commas, spaces or newlines (empty line to finish): ")
+              run_common_prime(argparse.Namespace(moduli=moduli, moduli_file=None))
               break
 
          elif (choix==9):
               print (colored("Private Key Computation ......","magenta"))
               print (colored("This attack ","yellow"))
-              p = int(input("Enter the value of p >> "))
-              q = int(input("Enter the value of q >> "))
-              e = int(input("Enter the value of e >> "))
-              d = PrivateKey(p,q,e)
-              console.print (f"[bold green]Succesfull retrieved, d = {d} [/bold green]")
+              p = read_int("Enter the value of p >> ")
+              q = read_int("Enter the value of q >> ")
+              e = read_int("Enter the value of e >> ")
+              run_private_key(argparse.Namespace(p=p, q=q, e=e))
+              break
+
+         elif (choix==10):
+              print (colored("Pollard's p-1 Attack ......","magenta"))
+              print (colored("This attack ","yellow"))
+              B = read_int("Enter the value of B (2 by default): ", 2)
+              N = read_int("Enter the value of N: ")
+              run_pollard_p1(argparse.Namespace(B=B, n=N))
               break
 
 
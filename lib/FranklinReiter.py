@@ -2,15 +2,58 @@ import gmpy2
 
 theorem= "Suppose there are two messages M1 and M2 where M1 != M2, both less than N and related to each other as equation [ M2 = f(M1) (mod N) ] for some linear polynomial equation [ f = ax + b ] where b!=0. These two messages are to be sent by encrypting using the public key (N, e), thus giving ciphertexts C1 and C2 respectively. Then, given (N, e, C1, C2, f), the attacker can recover messages M1 and M2"
 
-def FranklinReiter(n, e, c1, c2, a, b):
-    print (theorem)
-    for possible_m1 in range(0, n):
-        if gmpy2.powmod(possible_m1, e, n) == c1:
-            possible_m2 = a * possible_m1 + b
-            if gmpy2.powmod(possible_m2, e, n) == c2:
-                return possible_m1, possible_m2
+# the schoolbook polynomial gcd costs O(e^2) multiplications, beyond this it would hang
+MAX_E = 1 << 12
 
-    raise ValueError("Les messages m1 et m2 n'ont pas été trouvés")
+# Polynomials over Z/nZ are lists of coefficients, lowest degree first.
 
+def poly_rem(a, b, n):
+    a = list(a)
+    db = len(b) - 1
+    g = gmpy2.gcd(b[-1], n)
+    if g != 1:
+        raise ValueError(f"coefficient dominant non inversible modulo N, facteur de N trouvé : {g}")
+    inv = gmpy2.invert(b[-1], n)
+    while len(a) > db:
+        coef = a[-1] * inv % n
+        shift = len(a) - 1 - db
+        for i in range(db):
+            a[shift + i] = (a[shift + i] - coef * b[i]) % n
+        a.pop()
+        while a and a[-1] == 0:
+            a.pop()
+    return a
 
+def poly_gcd(a, b, n):
+    while b:
+        a, b = b, poly_rem(a, b, n)
+    return a
 
+def FranklinReiter(n, e, c1, c2, a, b):
+    print (theorem)
+    n, e = gmpy2.mpz(n), int(e)
+    if e > MAX_E:
+        raise ValueError(f"e = {e} est trop grand pour le PGCD polynomial (e <= {MAX_E})")
+    if a % n == 0:
+        raise ValueError("a = 0 (mod N), f n'est pas une fonction linéaire de M1")
+    # g1 = x^e - c1
+    g1 = [(-c1) % n] + [gmpy2.mpz(0)] * (e - 1) + [gmpy2.mpz(1)]
+    # g2 = (a*x + b)^e - c2, binomial terms built with running products
+    b_pows = [gmpy2.mpz(1)]
+    for _ in range(e):
+        b_pows.append(b_pows[-1] * b % n)
+    g2 = []
+    binom, a_pow = gmpy2.mpz(1), gmpy2.mpz(1)
+    for k in range(e + 1):
+        g2.append(binom * a_pow % n * b_pows[e - k] % n)
+        binom = binom * (e - k) // (k + 1)
+        a_pow = a_pow * a % n
+    g2[0] = (g2[0] - c2) % n
+    g = poly_gcd(g1, g2, n)
+    if len(g) == 2:
+        m1 = (-g[0] * gmpy2.invert(g[1], n)) % n
+        m2 = (a * m1 + b) % n
+        if gmpy2.powmod(m1, e, n) == c1 % n and gmpy2.powmod(m2, e, n) == c2 % n:
+            return m1, m2
+
+    raise ValueError("Les messages m1 et m2 n'ont pas été trouvés")
@@ -1,14 +1,42 @@
-import math
+import gmpy2
+from collections import Counter
 from termcolor import colored
 
-def PremierCommun(N1,N2):
-    p = math.gcd(N1,N2)
-    q = N1 // p
-    r = N2 // p
-    assert (p*r == N2)
-    assert (p*q == N1)
-    print (colored(f"[+]Successfull factorized !","green"))
-    print (colored(f"[+]for {N1}, p = {p} and q = {q}","yellow"))
-    print (colored(f"[+]for {N2}, p = {p} and q = {r}","yellow"))
+def product_tree(moduli):
+    tree = [list(moduli)]
+    while len(tree[-1]) > 1:
+        level = tree[-1]
+        tree.append([level[i] * level[i+1] for i in range(0, len(level) - 1, 2)] + level[len(level) & ~1:])
+    return tree
 
+def batch_gcd(moduli):
+    # Bernstein: gcd(N_i, (prod(N) mod N_i^2) / N_i) through a product tree and a remainder tree
+    moduli = [gmpy2.mpz(N) for N in moduli]
+    tree = product_tree(moduli)
+    rems = tree.pop()
+    while tree:
+        level = tree.pop()
+        rems = [gmpy2.f_mod(rems[i // 2], x * x) for i, x in enumerate(level)]
+    return [gmpy2.gcd(r // N, N) for r, N in zip(rems, moduli)]
 
+def PremierCommun(*moduli):
+    counts = Counter(moduli)
+    for N, c in counts.items():
+        if c > 1:
+            print (colored(f"[!]{N} appears {c} times, identical moduli cannot be split by gcd","red"))
+    moduli = sorted(counts, key=lambda N: N.bit_length())
+    found = False
+    for N, p in zip(moduli, batch_gcd(moduli)):
+        if p == N:
+            # both primes are shared with other moduli, fall back to pairwise gcds
+            p = max(gmpy2.gcd(N, M) for M in moduli if M != N)
+        if p == 1 or p == N:
+            continue
+        q, r = gmpy2.f_divmod(N, p)
+        assert (r == 0)
+        if not found:
+            print (colored(f"[+]Successfull factorized !","green"))
+        found = True
+        print (colored(f"[+]for {N}, p = {p} and q = {q}","yellow"))
+    if not found:
+        print (colored("[-]No common prime factor found !","red"))
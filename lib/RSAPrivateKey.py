@@ -1,4 +1,6 @@
+import gmpy2
+
 def PrivateKey(p,q,e):
-    phi = (p-1)*(q-1)
-    d = pow(e,-1,phi)
+    phi = (gmpy2.mpz(p)-1)*(gmpy2.mpz(q)-1)
+    d = int(gmpy2.invert(e,phi))
     return d
@@ -1,17 +1,32 @@
-from Crypto.Util.number import *
+import gmpy2
 from termcolor import colored
 
+MAX_DISPLAY = 512
+
 def Encode(e,n,m):
-    c = pow(m,e,n)
+    c = int(gmpy2.powmod(m,e,n))
     print (f"the CipherText is {c}")
 
 
-def Decode(c,n,d):
-    m = pow(c,d,n)
+def Decode(c,n,d,p=None,q=None):
+    if p and q:
+        # CRT: two half-size exponentiations instead of one full-size one
+        p, q = gmpy2.mpz(p), gmpy2.mpz(q)
+        if p == q or p*q != n:
+            raise ValueError("p et q doivent être deux facteurs distincts de n (p*q == n)")
+        mp = gmpy2.powmod(c, d % (p-1), p)
+        mq = gmpy2.powmod(c, d % (q-1), q)
+        h = (gmpy2.invert(q, p) * (mp - mq)) % p
+        m = int(mq + h*q)
+    else:
+        m = int(gmpy2.powmod(c,d,n))
     print (f"The Original message is {m}")
+    raw = m.to_bytes((m.bit_length()+7)//8, 'big')
+    more = f" ... ({len(raw)} bytes total)" if len(raw) > MAX_DISPLAY else ""
     try:
-       print (str(long_to_bytes(m).decode("utf-8")))
-    except:
+       text = raw.decode("utf-8")
+    except UnicodeDecodeError:
        print(colored("Failed to decode !!!","red"))
-
-
+       print (f"hex: {raw[:MAX_DISPLAY].hex()}{more}")
+    else:
+       print (f"{text[:MAX_DISPLAY]}{more}")
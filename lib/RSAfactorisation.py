@@ -1,25 +1,79 @@
-from factordb.factordb import FactorDB
+import gmpy2
 from termcolor import colored
 
-def factorisation(n):
-   try:
-      f = FactorDB(n)
-      f.connect()
-      result = f.get_factor_list()
-      if (len(result) == 2):
-         p = result[0]
-         q = result[1]
-         print(f"{n} success factorized, p = {p} and q = {q}")
-      elif(len(result) >= 2):
-         s = len(result)
-         print ("success decomposed!")
-         for i in range(s):
-           print (f"{result[i]}")
-      else:
-         print (f"{n} can't be factorized !")
+from lib.pollar import Brent, TrialDivision
 
+def split(n):
+   p = TrialDivision(n)
+   if p:
+      return p
+   if gmpy2.is_square(n):
+      return gmpy2.isqrt(n)
+   if n.bit_length() <= 80:
+      c = 1
+      while True:
+         g = Brent(n, c)
+         if g != n:
+            return g
+         c += 1
+   if n.bit_length() <= 256:
+      from sympy.ntheory import ecm
+      try:
+         return min(ecm(int(n), max_curve=50))
+      except ValueError:
+         pass
+   return None
 
-   except:
-        print(colored("Failed to connect to the internet!","red"))
+def local_factorisation(n):
+   # prime factors found locally, plus the composite cofactors that resisted splitting
+   factors, rest, todo = [], [], [gmpy2.mpz(n)]
+   while todo:
+      m = todo.pop()
+      if m == 1:
+         continue
+      if gmpy2.is_prime(m):
+         factors.append(int(m))
+         continue
+      p = split(m)
+      if p is None:
+         rest.append(int(m))
+         continue
+      todo += [gmpy2.mpz(p), m // p]
+   return sorted(factors), rest
 
+def factorisation(n):
+   # trial division, Pollard-Brent and ECM first, FactorDB only for the cofactors they give up on
+   result, rest = local_factorisation(n)
+   unsplit = []
+   for m in rest:
+      try:
+         from factordb.factordb import FactorDB
+         f = FactorDB(m)
+         f.connect()
+         factors = f.get_factor_list()
+      except Exception:
+         print(colored("Failed to connect to the internet!","red"))
+         factors = []
+      if len(factors) >= 2:
+         result += factors
+      else:
+         unsplit.append(m)
+   result.sort()
 
+   if unsplit and result:
+      print ("partially decomposed!")
+      for p in result:
+        print (f"{p}")
+      for m in unsplit:
+        print (colored(f"{m} (not factorized)","red"))
+   elif (len(result) == 2):
+      p = result[0]
+      q = result[1]
+      print(f"{n} success factorized, p = {p} and q = {q}")
+   elif(len(result) >= 2):
+      s = len(result)
+      print ("success decomposed!")
+      for i in range(s):
+        print (f"{result[i]}")
+   else:
+      print (f"{n} can't be factorized !")
@@ -1,10 +1,28 @@
-import sympy
+import gmpy2
 
 def wiener(n, e):
-    fraction = sympy.continued_fraction(sympy.Rational(e, n))
-    for convergent in fraction:
-        k, d = convergent.numerator, convergent.denominator
-        if d > 0 and e * d % n == 1:
-            return d
+    n, e = gmpy2.mpz(n), gmpy2.mpz(e)
+    # d < n^(1/4) forces e > n^(3/4), so e <= sqrt(n) can never be broken
+    if e <= gmpy2.isqrt(n):
+        return None
+    # convergents k/d of e/n, one divmod per partial quotient
+    k_prev, k = gmpy2.mpz(0), gmpy2.mpz(1)
+    d_prev, d = gmpy2.mpz(1), gmpy2.mpz(0)
+    num, den = e, n
+    while den:
+        a, r = gmpy2.f_divmod(num, den)
+        k_prev, k = k, a * k + k_prev
+        d_prev, d = d, a * d + d_prev
+        num, den = den, r
+        if k == 0 or (e * d - 1) % k:
+            continue
+        # phi = (p-1)(q-1) gives p+q = n - phi + 1, so p and q are roots of x^2 - s*x + n
+        phi = (e * d - 1) // k
+        s = n - phi + 1
+        # p and q are odd, so an odd p+q is rejected before the square test
+        if s & 1:
+            continue
+        disc = s * s - 4 * n
+        if disc >= 0 and gmpy2.is_square(disc):
+            return int(d)
     return None
-
@@ -1,37 +1,129 @@
+import gmpy2
+import heapq
+import itertools
 import math
 from termcolor import colored
 
-def SquareAndMultiply(base,exponent,modulus):
-    binaryExponent = []
-    while exponent != 0:
-        binaryExponent.append(exponent%2)
-        exponent = exponent/2
-    result = 1
-    binaryExponent.reverse()
-    for i in binaryExponent:
-        if i == 0:
-            result = (result*result) % modulus
-        else:
-            result = (result*result*base) % modulus
-    return result
-
-def egcd(a, b) :
-    if a == 0 :
-        return (b, 0, 1)
-    else :
-        g, x, y = egcd(b % a, a)
-        return (g, y - (b // a) * x, x)
+def SmallPrimes(bound):
+    sieve = bytearray([1]) * (bound+1)
+    sieve[0] = sieve[1] = 0
+    for i in range(2, math.isqrt(bound)+1):
+        if sieve[i]:
+            sieve[i*i::i] = bytes(len(range(i*i, bound+1, i)))
+    return list(itertools.compress(range(bound+1), sieve))
 
-def PollardAttack(B,N):
-    a = 2
-    while True:
-        a = SquareAndMultiply(a, B, N)
-        p = egcd(a-1, N)
-        if p[0] != 1 :
-            print (colored("[+] Successfull factorized !","green"))
-            print ("p = "+str(p[0]))
-            print ("q = "+str(N//p[0]))
+SMALL_PRIMES = SmallPrimes(1 << 16)
+
+SMALL_SQUARE = SMALL_PRIMES[-1] ** 2
+
+# product of all SMALL_PRIMES, so a single gcd tells whether N has any small factor
+PRIMORIAL = gmpy2.primorial(1 << 16)
+
+EXPONENT_BITS = 1 << 16
+
+POWER_BOUND = 1 << 32
+
+def TrialDivision(N, bound=1 << 16):
+    bound = min(bound, math.isqrt(N))
+    if gmpy2.gcd(N, PRIMORIAL) == 1:
+        return None
+    for p in SMALL_PRIMES:
+        if p > bound:
             break
-        B += 1
+        if N % p == 0:
+            return p
+    return None
+
+def Brent(N, c=1, m=64):
+    # Brent's cycle detection on x -> x^2 + c, with one gcd per batch of m steps
+    N = gmpy2.mpz(N)
+    y, q, g, r = gmpy2.mpz(2), gmpy2.mpz(1), gmpy2.mpz(1), 1
+    while g == 1:
+        x = y
+        for _ in range(r):
+            y = (y*y + c) % N
+        k = 0
+        while k < r and g == 1:
+            ys = y
+            for _ in range(min(m, r-k)):
+                y = (y*y + c) % N
+                q = q * (x - y) % N
+            g = gmpy2.gcd(q, N)
+            k += m
+        r *= 2
+    if g == N:
+        # the batch overshot, replay it one step at a time
+        g = gmpy2.mpz(1)
+        while g == 1:
+            ys = (ys*ys + c) % N
+            g = gmpy2.gcd(x - ys, N)
+    return g
 
+def PollardRho(N):
+    if gmpy2.is_prime(N):
+        print (colored(f"[-] {N} is prime !","red"))
+        return
+    p = TrialDivision(N)
+    c = 1
+    while p is None:
+        g = Brent(N, c)
+        if g != N:
+            p = int(g)
+        c += 1
+    print (colored("[+] Successfull factorized !","green"))
+    print ("p = "+str(p))
+    print ("q = "+str(N//p))
 
+def PrimePowerBase(B):
+    # p when B = p^k for a prime p beyond SMALL_PRIMES, else None: lcm(1..B) = lcm(1..B-1) * p
+    if gmpy2.is_prime(B):
+        return B if B > SMALL_PRIMES[-1] else None
+    # a power of a prime beyond SMALL_PRIMES is at least SMALL_PRIMES[-1]^2
+    if B > SMALL_SQUARE and gmpy2.is_power(B):
+        for k in range(2, B.bit_length()):
+            r, exact = gmpy2.iroot(B, k)
+            if exact and gmpy2.is_prime(r):
+                return r if r > SMALL_PRIMES[-1] else None
+    return None
+
+def PollardAttack(B,N):
+    p = TrialDivision(N)
+    a = gmpy2.mpz(2)
+    # SMALL_PRIMES enter when B reaches them, then get a head start: r^k is folded
+    # as soon as r^k <= POWER_BOUND * B. The heap holds (B at which r gets its next
+    # factor, r, power of r folded so far).
+    powers = [(r, r, 1) for r in SMALL_PRIMES]
+    while p is None:
+        # fold prime powers into one exponent: one powmod and one gcd per batch
+        bases, E = [], gmpy2.mpz(1)
+        while E.bit_length() < EXPONENT_BITS:
+            if powers[0][0] <= B:
+                _, q, qk = heapq.heappop(powers)
+                qk *= q
+                heapq.heappush(powers, (gmpy2.c_div(qk * q, POWER_BOUND), q, qk))
+            else:
+                # the larger primes follow lcm(1..B)
+                q = PrimePowerBase(B)
+                B += 1
+            if q:
+                bases.append(q)
+                E *= q
+        a_prev, a = a, gmpy2.powmod(a, E, N)
+        g = gmpy2.gcd(a-1, N)
+        if g == N:
+            # both primes were reached in the same batch, replay it one step at a time
+            a = a_prev
+            for q in bases:
+                a = gmpy2.powmod(a, q, N)
+                g = gmpy2.gcd(a-1, N)
+                if g != 1:
+                    break
+            if g == N:
+                # p-1 and q-1 became smooth on the same prime power, no exponent separates them
+                print (colored(f"[-] Pollard's p-1 can't split {N} !","red"))
+                return
+        if g != 1 :
+            p = int(g)
+    print (colored("[+] Successfull factorized !","green"))
+    print ("p = "+str(p))
+    print ("q = "+str(N//p))